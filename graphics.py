@@ -1,7 +1,17 @@
 from tkinter import Tk, BOTH, Canvas
+from collections import deque
 import time
 import random
 
+try:
+    from PIL import Image, ImageDraw, ImageTk
+except ImportError:
+    Image = ImageDraw = ImageTk = None
+
+LEFT, RIGHT, UP, DOWN = 1, 2, 4, 8
+WALL_SLOT = {LEFT: 0, RIGHT: 1, UP: 2, DOWN: 3}
+NEIGHBOR_PICKS = tuple(tuple(k for k in range(4) if mask >> k & 1) for mask in range(16))
+
 
 class Point:
     """
@@ -26,15 +36,18 @@ class Line:
     def __init__(self, point_a: Point, point_b: Point):
         self.point_a, self.point_b = point_a, point_b
         
-    def draw(self, canvas: Canvas, fill_color: str) -> None:
+    def draw(self, canvas: Canvas, fill_color: str) -> int:
         '''
         Draws this line on a given Tkinter Canvas with the specified fill color.
 
         Args:
             canvas (Canvas): The Tkinter Canvas on which to draw the line.
             fill_color (str): The color to use for the line.
+
+        Returns:
+            int: The canvas item id of the created line.
         '''
-        canvas.create_line(self.point_a.x, self.point_a.y, self.point_b.x, self.point_b.y,
+        return canvas.create_line(self.point_a.x, self.point_a.y, self.point_b.x, self.point_b.y,
                            fill = fill_color, width = 2)
 
 
@@ -46,6 +59,7 @@ class Window:
         width (int): The width of the window in pixels.
         height (int): The height of the window in pixels.
         running (bool): Indicates if the window event loop is active.
+        bulk (int): The nesting depth of bulk updates; per-frame redraws are suspended while it is above 0.
     """
     
     def __init__(self, width : int, height: int) -> None: 
@@ -56,7 +70,7 @@ class Window:
             width (int): The width of the window in pixels.
             height (int): The height of the window in pixels.
         """
-        self.width, self.height, self.__root, self.running = width, height, Tk(), False
+        self.width, self.height, self.__root, self.running, self.bulk = width, height, Tk(), False, 0
         self.canvas =  Canvas(self.__root, bg = 'white', width = self.width, height = self.height)
         self.__root.title('Maze Solver v1.0')
         self.canvas.pack()
@@ -69,6 +83,28 @@ class Window:
         """
         self.__root.update_idletasks()
         self.__root.update()
+    
+    
+    def redraw_idle(self) -> None:
+        """
+        Flushes pending redraws without processing the rest of the event queue.
+        """
+        self.__root.update_idletasks()
+    
+    
+    def begin_bulk(self) -> None:
+        """
+        Suspends per-frame redraws until the matching end_bulk call. Calls may be nested.
+        """
+        self.bulk += 1
+    
+    
+    def end_bulk(self) -> None:
+        """
+        Ends the innermost bulk update, redrawing the window once the outermost one ends.
+        """
+        self.bulk -= 1
+        if not self.bulk: self.redraw()
         
     
     def wait_for_close(self) -> None:
@@ -87,276 +123,259 @@ class Window:
         self.running = False
         
     
-    def draw_line(self, line: Line, fill_color: str) -> None:
+    def draw_line(self, line: Line, fill_color: str) -> int:
         """
         Draws a given Line object onto the window's canvas with the specified color.
 
         Args:
             line (Line): The Line to be drawn.
             fill_color (str): The color of the line.
+
+        Returns:
+            int: The canvas item id of the created line.
         """
-        line.draw(self.canvas, fill_color)
+        return line.draw(self.canvas, fill_color)
+    
+    
+    def draw_segment(self, x1: int, y1: int, x2: int, y2: int, fill_color: str) -> int:
+        """
+        Draws a line between two raw coordinate pairs without building Point or Line objects.
+
+        Args:
+            x1 (int): The horizontal position of the starting point in pixels.
+            y1 (int): The vertical position of the starting point in pixels.
+            x2 (int): The horizontal position of the ending point in pixels.
+            y2 (int): The vertical position of the ending point in pixels.
+            fill_color (str): The color of the line.
+
+        Returns:
+            int: The canvas item id of the created line.
+        """
+        return self.canvas.create_line(x1, y1, x2, y2, fill = fill_color, width = 2)
     
         
 class Cell:
-    def __init__(self, window: Window | None = None) -> None:
+    def __init__(self, window: Window | None = None,
+                 x1: int = -1, y1: int = -1, x2: int = -1, y2: int = -1) -> None:
         self.__win  = window
-        self.has_left_wall, self.has_right_wall,self.has_top_wall, self.has_bottom_wall = True, True, True, True
-        self.__x1, self.__x2, self.__y1, self.__y2 = -1, -1, -1, -1
-        self.visited = False
-        self.valid_dirs = {}
-       
-    def draw(self, x1: int, y1: int, x2: int, y2: int) -> None:
         self.__x1, self.__y1,self.__x2, self.__y2 = x1, y1, x2, y2
-        
+        self._wall_ids = [None] * 4
+    
+    def draw_walls(self, left_id: int | None = None, top_id: int | None = None) -> None:
         if self.__win:
+            wall_ids = self._wall_ids
             
-            if self.has_left_wall: self.__win.draw_line(Line(Point(self.__x1, self.__y1), Point(self.__x1, self.__y2)), 'black')
-            else: self.__win.draw_line(Line(Point(self.__x1, self.__y1), Point(self.__x1, self.__y2)), 'white')
+            if wall_ids[0] is None: wall_ids[0] = left_id if left_id is not None else self.__win.draw_segment(self.__x1, self.__y1, self.__x1, self.__y2, 'black')
             
-            if self.has_right_wall: self.__win.draw_line(Line(Point(self.__x2, self.__y1), Point(self.__x2, self.__y2)), 'black')
-            else: self.__win.draw_line(Line(Point(self.__x2, self.__y1), Point(self.__x2, self.__y2)), 'white')
+            if wall_ids[1] is None: wall_ids[1] = self.__win.draw_segment(self.__x2, self.__y1, self.__x2, self.__y2, 'black')
             
-            if self.has_top_wall: self.__win.draw_line(Line(Point(self.__x1, self.__y1), Point(self.__x2, self.__y1)), 'black')
-            else: self.__win.draw_line(Line(Point(self.__x1, self.__y1), Point(self.__x2, self.__y1)), 'white')
+            if wall_ids[2] is None: wall_ids[2] = top_id if top_id is not None else self.__win.draw_segment(self.__x1, self.__y1, self.__x2, self.__y1, 'black')
             
-            if self.has_bottom_wall: self.__win.draw_line(Line(Point(self.__x1, self.__y2), Point(self.__x2, self.__y2)), 'black')
-            else: self.__win.draw_line(Line(Point(self.__x1, self.__y2), Point(self.__x2, self.__y2)), 'white')
+            if wall_ids[3] is None: wall_ids[3] = self.__win.draw_segment(self.__x1, self.__y2, self.__x2, self.__y2, 'black')
     
-    def draw_move(self, to_cell, undo: bool = False) -> None:
-        if not undo:self.__win.draw_line(Line(
-            Point((self.__x1 + self.__x2) // 2, (self.__y1 + self.__y2) // 2),
-            Point((to_cell.__x1 + to_cell.__x2) // 2, (to_cell.__y1 + to_cell.__y2) // 2)
-            ), 'red')
-            
-        else: 
-            self.__win.draw_line(Line(
-            Point((self.__x1 + self.__x2) // 2, (self.__y1 + self.__y2) // 2),
-            Point((to_cell.__x1 + to_cell.__x2) // 2, (to_cell.__y1 + to_cell.__y2) // 2)
-            ), 'gray')
-            if self.__x1 > to_cell.__x1:
-             self.valid_dirs['left'], to_cell.valid_dirs['right'] = False, False
-            if self.__x1 < to_cell.__x1:
-                self.valid_dirs['right'], to_cell.valid_dirs['left'] = False, False 
-            if self.__y1 > to_cell.__y1:
-                self.valid_dirs['up'], to_cell.valid_dirs['down'] = False, False
-            if self.__y1 < to_cell.__y1:
-                self.valid_dirs['down'], to_cell.valid_dirs['up'] = False, False
+    def draw_move(self, to_cell) -> None:
+        if not self.__win: return
+        self.__win.draw_segment(
+            (self.__x1 + self.__x2) // 2, (self.__y1 + self.__y2) // 2,
+            (to_cell.__x1 + to_cell.__x2) // 2, (to_cell.__y1 + to_cell.__y2) // 2,
+            'red')
+
+
+def _wall_runs(edges: bytes | bytearray) -> list[tuple[int, int]]:
+    """
+    Finds the contiguous runs of standing walls along one grid line.
+    
+    Returns:
+        list[tuple[int, int]]: The half-open (start, end) index ranges of the runs.
+    """
+    runs, start = [], edges.find(1)
+    while start != -1:
+        end = edges.find(0, start)
+        if end == -1: end = len(edges)
+        runs.append((start, end))
+        start = edges.find(1, end)
+    return runs
+
+
+def _break_walls_kernel(visited: list[bytearray],
+                        neighbors: list[list[tuple[tuple[int, int, int, bytearray, int], ...]]],
+                        i: int, j: int, rng: random.Random) -> list[tuple[int, int, int]]:
+    """
+    Carves passages from cell (i, j) by clearing the shared walls referenced by neighbors, touching no canvas state.
+    Neighbors are picked with rng, so the same seed always carves the same maze.
+    
+    Returns:
+        list[tuple[int, int, int]]: The broken walls in carving order, as (i, j, direction).
+    """
+    broken_walls, stack = [], [(i, j)]
+    pop, push, record, rand = stack.pop, stack.append, broken_walls.append, rng.random
+    visited[i][j] = 1
+    while stack:
+        i, j = stack[-1]
+        cell_neighbors, unvisited = neighbors[i][j], 0
+        for k, neighbor in enumerate(cell_neighbors):
+            if not visited[neighbor[0]][neighbor[1]]: unvisited |= 1 << k
+        
+        if not unvisited:
+            pop()
+            continue
+        
+        picks = NEIGHBOR_PICKS[unvisited]
+        i_index, j_index, direction, wall_column, wall_row = cell_neighbors[picks[int(rand() * len(picks))]]
+        wall_column[wall_row] = 0
+        record((i, j, direction))
+        push((i_index, j_index))
+        visited[i_index][j_index] = 1
+    return broken_walls
+
+
+def _solve_kernel(visited: list[bytearray],
+                  neighbors: list[list[tuple[tuple[int, int, int, bytearray, int], ...]]],
+                  i: int, j: int) -> list[tuple[int, int]]:
+    """
+    Breadth-first searches the open passages from cell (i, j) to the bottom-right cell.
+    
+    Returns:
+        list[tuple[int, int]]: The cells of the shortest path, start first, or an empty list if the goal is unreachable.
+    """
+    goal = (len(visited) - 1, len(visited[0]) - 1)
+    parent, queue = {(i, j): None}, deque([(i, j)])
+    popleft, push = queue.popleft, queue.append
+    visited[i][j] = 1
+    while queue:
+        
+        cell = popleft()
+        
+        if cell == goal: break
+        
+        i, j = cell
+        for i_index, j_index, _, wall_column, wall_row in neighbors[i][j]:
+            if not wall_column[wall_row] and not visited[i_index][j_index]:
+                visited[i_index][j_index] = 1
+                parent[(i_index, j_index)] = cell
+                push((i_index, j_index))
+    else: return []
+    
+    path, cell = [], goal
+    while cell is not None:
+        path.append(cell)
+        cell = parent[cell]
+    path.reverse()
+    return path
 
 
 class Maze:
     def __init__(self, win: Window | None, num_rows: int, num_cols: int,
                  cell_size_x: int,  cell_size_y: int, x1: int = 0, y1: int = 0,
-                 seed: int | None = None) -> None:
+                 seed: int | None = None, animate: bool = True) -> None:
         self.x1, self.y1, self.num_rows, self.num_cols = x1, y1, num_rows, num_cols
         self.cell_size_x, self.cell_size_y, self.__win, self.__cells = cell_size_x, cell_size_y, win, []
+        self.__neighbors = []
+        self.animate, self.__last_anim = animate, 0.0
+        self._photo = None
+        self.v_walls = [bytearray(b'\x01' * num_rows) for _ in range(num_cols + 1)]
+        self.h_walls = [bytearray(b'\x01' * (num_rows + 1)) for _ in range(num_cols)]
+        self.visited = [bytearray(num_rows) for _ in range(num_cols)]
+        self.seed, self._rng = seed, random.Random(seed)
+        if win and not animate: win.begin_bulk()
         self.__create_cells()
-        if seed: random.seed(seed)
-        self.seed = seed
+        if win and not animate: win.end_bulk()
         
     def __create_cells(self) -> None:
         for i in range(self.num_cols):
             self.__cells.append([])
             for j in range(self.num_rows):
-                self.__cells[i].append(Cell(self.__win)) 
-                self.__draw_cell(i, j)
+                left_x_pos = self.x1 + i * self.cell_size_x
+                top_y_pos =  self.y1 + j * self.cell_size_y
+                self.__cells[i].append(Cell(self.__win, left_x_pos, top_y_pos,
+                                            left_x_pos + self.cell_size_x,
+                                            top_y_pos + self.cell_size_y)) 
+        
+        for i in range(self.num_cols):
+            self.__neighbors.append([])
+            for j in range(self.num_rows):
+                self.__neighbors[i].append(tuple(
+                    (i + di, j + dj, direction, wall_column, wall_row)
+                    for di, dj, direction, wall_column, wall_row in (
+                        (-1, 0, LEFT, self.v_walls[i], j), (1, 0, RIGHT, self.v_walls[i + 1], j),
+                        (0, -1, UP, self.h_walls[i], j), (0, 1, DOWN, self.h_walls[i], j + 1))
+                    if 0 <= i + di < self.num_cols and 0 <= j + dj < self.num_rows))
         
         if self.num_cols > 0 and self.num_rows > 0: 
             self.__break_entrance_and_exit()            
                  
-    def __draw_cell(self, i: int, j: int) -> None:
-        left_x_pos = i * self.cell_size_x
-        top_y_pos =  j * self.cell_size_y
-        self.__cells[i][j].draw(self.x1 + left_x_pos,
-                                self.y1 + top_y_pos,
-                                self.x1 + left_x_pos + self.cell_size_x,
-                                self.y1 + top_y_pos + self.cell_size_y)
-
-        if self.__win: self._animate()
+    def __draw_grid(self) -> None:
+        self.__win.begin_bulk()
+        for i in range(self.num_cols):
+            for j in range(self.num_rows):
+                self.__cells[i][j].draw_walls(self.__cells[i - 1][j]._wall_ids[WALL_SLOT[RIGHT]] if i > 0 else None,
+                                              self.__cells[i][j - 1]._wall_ids[WALL_SLOT[DOWN]] if j > 0 else None)
+        self.__win.end_bulk()
     
-    def _animate(self) -> None:
-            self.__win.redraw()
-            time.sleep(0.001) 
-            
-    def __break_entrance_and_exit(self) -> None:
-            self.__cells[0][0].has_top_wall = False
-            self.__cells[self.num_cols -1][self.num_rows -1].has_bottom_wall =  False
-            self.__draw_cell(0, 0)
-            self.__draw_cell(self.num_cols -1, self.num_rows -1)
-            if self.num_cols * self.num_rows < 1000:
-                self.__break_walls_r(0, 0)
-            else: self.__break_walls_l(0, 0)
-            self.__reset_cells_visited()
-            
-    def __break_walls_l(self, i: int, j: int) -> None:
-        stack = [(i, j)]
-        while stack:
-            i, j = stack.pop()
-            self.__cells[i][j].visited = True
-            indexes_to_visit = []
-            if i - 1 >= 0 and not self.__cells[i - 1][j].visited: indexes_to_visit.append((i - 1, j))
-            
-            if i + 1 < self.num_cols and not self.__cells[i + 1][j].visited: indexes_to_visit.append((i + 1, j))
+    def __erase_wall(self, i: int, j: int, direction: int) -> None:
+        if not (self.__win and self.animate): return
+        self.__win.canvas.delete(self.__cells[i][j]._wall_ids[WALL_SLOT[direction]])
+        self._animate()
     
-            if j - 1 >= 0 and not self.__cells[i][j -1].visited: indexes_to_visit.append((i, j - 1))     
-            
-            if j + 1 < self.num_rows and not self.__cells[i][j + 1].visited: indexes_to_visit.append((i, j + 1))
-            
-            random.shuffle(indexes_to_visit)
-            
-            for pair in indexes_to_visit:
-                i_index, j_index = pair
-                if i_index < i: 
-                    self.__cells[i][j].has_left_wall, self.__cells[i_index][j_index].has_right_wall = False, False
-                    self.__cells[i][j].valid_dirs['left'], self.__cells[i_index][j_index].valid_dirs['right'] = True, True
-                
-                elif i_index > i: 
-                    self.__cells[i][j].has_right_wall, self.__cells[i_index][j_index].has_left_wall = False, False
-                    self.__cells[i][j].valid_dirs['right'], self.__cells[i_index][j_index].valid_dirs['left'] = True, True
-                
-                elif j_index < j:
-                    self.__cells[i][j].has_top_wall, self.__cells[i_index][j_index].has_bottom_wall = False, False
-                    self.__cells[i][j].valid_dirs['up'], self.__cells[i_index][j_index].valid_dirs['down'] = True, True
-                
-                elif j_index > j:
-                    self.__cells[i][j].has_bottom_wall, self.__cells[i_index][j_index].has_top_wall = False, False
-                    self.__cells[i][j].valid_dirs['down'], self.__cells[i_index][j_index].valid_dirs['up'] = True, True
-                    
-                stack.append((i_index, j_index))
-                self.__cells[i_index][j_index].visited = True
-                self.__draw_cell(i, j)
-                self.__draw_cell(i_index, j_index)
-                
-    def __break_walls_r(self, i: int, j: int) -> None:
+    def __draw_walls(self) -> None:
+        if not self.__win: return
         
-        self.__cells[i][j].visited = True
+        wall_runs = []
+        for i, column in enumerate(self.v_walls):
+            x = self.x1 + i * self.cell_size_x
+            for start, end in _wall_runs(column):
+                wall_runs.append((x, self.y1 + start * self.cell_size_y, x, self.y1 + end * self.cell_size_y))
         
-        while True:
-            need_to_visit = []
-            if i - 1 > 0 and not self.__cells[i - 1][j].visited:
-                need_to_visit.append((i - 1, j))
-            
-            if i + 1 < self.num_cols and not self.__cells[i + 1][j].visited:
-                need_to_visit.append((i + 1, j))
-            
-            if j - 1 > 0 and not self.__cells[i][j - 1].visited:
-                need_to_visit.append((i, j - 1))
-            
-            if j + 1 < self.num_rows and not self.__cells[i][j + 1].visited:
-                need_to_visit.append((i, j + 1))
+        for j in range(self.num_rows + 1):
+            y = self.y1 + j * self.cell_size_y
+            for start, end in _wall_runs(bytes(column[j] for column in self.h_walls)):
+                wall_runs.append((self.x1 + start * self.cell_size_x, y, self.x1 + end * self.cell_size_x, y))
+        
+        if Image:
+            left, top = self.x1 - 1, self.y1 - 1
+            image = Image.new('RGBA', (self.num_cols * self.cell_size_x + 2, self.num_rows * self.cell_size_y + 2), (0, 0, 0, 0))
+            image_draw = ImageDraw.Draw(image)
+            # Pillow paints a width-2 line at x over x..x+1 where Tk paints x-1..x, hence the shift by x1/y1 not left/top.
+            for x1, y1, x2, y2 in wall_runs:
+                image_draw.line([(x1 - self.x1, y1 - self.y1), (x2 - self.x1, y2 - self.y1)], fill = 'black', width = 2)
+            self._photo = ImageTk.PhotoImage(image)
+            self.__win.canvas.create_image(left, top, anchor = 'nw', image = self._photo)
+        else:
+            for x1, y1, x2, y2 in wall_runs: self.__win.draw_segment(x1, y1, x2, y2, 'black')
+    
+    def _animate(self) -> None:
+            if not self.__win or self.__win.bulk: return
+            now = time.monotonic()
+            if now - self.__last_anim < 0.016: return
+            self.__last_anim = now
+            self.__win.redraw_idle()
             
-            if not need_to_visit:
-                self.__draw_cell(i, j)
-                return
+    def __break_entrance_and_exit(self) -> None:
+            self.h_walls[0][0] = 0
+            self.h_walls[self.num_cols -1][self.num_rows] = 0
+            broken_walls = self.__break_walls(0, 0)
+            if self.__win and self.animate:
+                self.__draw_grid()
+                self.__erase_wall(0, 0, UP)
+                self.__erase_wall(self.num_cols -1, self.num_rows -1, DOWN)
+                for i, j, direction in broken_walls: self.__erase_wall(i, j, direction)
+                if not self.__win.bulk: self.__win.redraw()
+            else: self.__draw_walls()
+            self.__reset_cells_visited()
             
-            else: 
-                next_index_i, next_index_j = random.choice(need_to_visit)
-                if next_index_i < i:
-                    self.__cells[i][j].has_left_wall, self.__cells[next_index_i][j].has_right_wall = False, False
-                    
-                elif next_index_i > i:
-                    self.__cells[i][j].has_right_wall, self.__cells[next_index_i][j].has_left_wall = False, False
-                
-                elif next_index_j < j:
-                    self.__cells[i][j].has_top_wall, self.__cells[i][next_index_j].has_bottom_wall = False, False
-                    
-                elif next_index_j > j:
-                    self.__cells[i][j].has_bottom_wall, self.__cells[i][next_index_j].has_top_wall = False, False
-                    
-                self.__draw_cell(i, j)
-                self.__draw_cell(next_index_i, next_index_j)
-                self.__break_walls_r(next_index_i, next_index_j)
+    def __break_walls(self, i: int, j: int) -> list[tuple[int, int, int]]:
+        return _break_walls_kernel(self.visited, self.__neighbors, i, j, self._rng)
                 
     def __reset_cells_visited(self) -> None:
-        for i in range(self.num_cols):
-            for j in range(self.num_rows):
-                self.__cells[i][j].visited = False
+        cleared = bytes(self.num_rows)
+        for column in self.visited: column[:] = cleared
         self.solve()
                
     def solve(self) -> None:
-        if self.num_cols * self.num_rows < 1000: self._solve_r(0, 0)
-        else: self._solve_l(0, 0)
+        self._solve(0, 0)
     
-    def _solve_r(self, i: int, j: int) -> bool:
-        self._animate()
-        self.__cells[i][j].visited = True
-        
-        if i + 1 == self.num_cols and j + 1 == self.num_rows:
-            return True
-                
-            
-        if i - 1 > 0:
-            if not self.__cells[i][j].has_left_wall and not self.__cells[i - 1][j].has_right_wall and not self.__cells[i- 1][j].visited:
-                self.__cells[i][j].draw_move(self.__cells[i - 1][j])
-                if self._solve_r(i - 1, j):
-                    return True
-                else:
-                    self.__cells[i][j].draw_move(self.__cells[i - 1][j], True)
-       
-        if i < self.num_cols:
-            if not self.__cells[i][j].has_right_wall and not self.__cells[i + 1][j].has_left_wall and not self.__cells[i + 1][j].visited:
-                self.__cells[i][j].draw_move(self.__cells[i + 1][j])
-                if self._solve_r(i + 1, j): 
-                    return True 
-                else:
-                    self.__cells[i][j].draw_move(self.__cells[i + 1][j], True)
-        
-        if j - 1 > 0:
-            if not self.__cells[i][j].has_top_wall and not self.__cells[i][j - 1].has_bottom_wall and not self.__cells[i][j - 1].visited:
-                self.__cells[i][j].draw_move(self.__cells[i][j - 1])
-                if self._solve_r(i, j - 1):
-                    return True
-                else:
-                    self.__cells[i][j].draw_move(self.__cells[i][j - 1], True)
-        
-        if j < self.num_rows:
-            if not self.__cells[i][j].has_bottom_wall and not self.__cells[i][j + 1].has_top_wall and not self.__cells[i][j + 1].visited:
-                self.__cells[i][j].draw_move(self.__cells[i][j + 1])
-                if self._solve_r(i, j + 1):
-                    return True
-                else:
-                    self.__cells[i][j].draw_move(self.__cells[i][j + 1], True)
-        
-        return False
-
-    def _solve_l(self, i: int, j: int) -> None:
-        stack = [(i, j)]
-        while stack:
-            
-            i, j = stack.pop()
-            
-            if i + 1 == self.num_cols and j + 1 == self.num_rows: return
-            
-            if i - 1 >= 0:
-                if not self.__cells[i][j].has_left_wall and not self.__cells[i - 1][j].visited:
-                    self.__cells[i - 1][j].visited = True
-                    self.__cells[i][j].draw_move(self.__cells[i - 1][j])
-                    self._animate()
-                    stack.append((i - 1, j))
-                    if not self.__cells[i][j].valid_dirs['left']: self.__cells[i][j].draw_move(self.__cells[i - 1][j], True)
-            
-            if i + 1 < self.num_cols:
-                if not self.__cells[i][j].has_right_wall and not self.__cells[i + 1][j].visited:
-                    self.__cells[i + 1][j].visited = True
-                    self.__cells[i][j].draw_move(self.__cells[i + 1][j])
-                    self._animate()
-                    stack.append((i + 1, j))
-                    if not self.__cells[i][j].valid_dirs['right']: self.__cells[i][j].draw_move(self.__cells[i + 1][j], True)
-            
-            if j - 1 >= 0:
-                if not self.__cells[i][j].has_top_wall and not self.__cells[i][j - 1].visited:
-                    self.__cells[i][j - 1].visited = True
-                    self.__cells[i][j].draw_move(self.__cells[i][j - 1])
-                    self._animate()
-                    stack.append((i, j - 1))
-                    if not self.__cells[i][j].valid_dirs['up']: self.__cells[i][j].draw_move(self.__cells[i][j - 1], True)
-                    
-                    
-                    
-            if j + 1 < self.num_rows:
-                if not self.__cells[i][j].has_bottom_wall and not self.__cells[i][j + 1].visited:
-                    self.__cells[i][j + 1].visited = True
-                    self.__cells[i][j].draw_move(self.__cells[i][j + 1])
-                    self._animate()
-                    stack.append((i, j + 1))
-                    if not self.__cells[i][j].valid_dirs['down']: self.__cells[i][j].draw_move(self.__cells[i][j + 1], True)
\ No newline at end of file
+    def _solve(self, i: int, j: int) -> None:
+        path = _solve_kernel(self.visited, self.__neighbors, i, j)
+        for (i, j), (i_index, j_index) in zip(path, path[1:]):
+            self.__cells[i][j].draw_move(self.__cells[i_index][j_index])
+            self._animate()
\ No newline at end of file